@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import ast
+import datetime as dt
+import dbm
+import hashlib
+import os
+import shelve
+import typing as t
+from pathlib import Path
+
+import pandas as pd
+
+from ppg_log import __version__, parser
+
+if t.TYPE_CHECKING:
+    from ppg_log import metrics
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "ppg_log"
+CACHE_FILENAME = "log_metadata"
+PARSED_LOG_DIRNAME = "parsed_logs"
+
+ParsedT = t.TypeVar("ParsedT")
+
+
+def cache_key(log_file: Path, **params: t.Any) -> str:
+    """
+    Build a cache key for the provided log file & its processing parameters.
+
+    Log files are identified by their resolved path, modification time, and size, so any changes to
+    the log file on disk will invalidate its cached entry. The package version is also included so
+    entries cached by a different version of `ppg_log` are never reused.
+    """
+    stat = log_file.stat()
+    file_id = (os.fspath(log_file.resolve()), stat.st_mtime_ns, stat.st_size)
+    return repr((__version__, file_id, sorted(params.items())))
+
+
+def _is_stale(key: str, current_ids: dict[str, tuple[str, int, int]]) -> bool:
+    """
+    Check whether the provided cache key has been superseded.
+
+    Keys are stale if they were cached by a different version of `ppg_log`, or if they refer to a
+    log file in `current_ids` (file path -> file identity) whose identity has since changed.
+
+    NOTE: Keys that can't be parsed are considered stale.
+    """
+    try:
+        version, file_id, _ = ast.literal_eval(key)
+    except (ValueError, SyntaxError, TypeError):
+        return True
+
+    if version != __version__:
+        return True
+
+    return file_id[0] in current_ids and tuple(file_id) != current_ids[file_id[0]]
+
+
+def lookup(cache_dir: Path, keys: t.Iterable[str]) -> dict[str, metrics.LogMetadata | None]:
+    """
+    Get any cached processing results for the provided cache keys.
+
+    NOTE: Entries that can't be unpickled are treated as cache misses.
+    """
+    try:
+        cache = shelve.open(os.fspath(cache_dir / CACHE_FILENAME), flag="r")
+    except dbm.error:
+        # No cache has been created yet
+        return {}
+
+    cached: dict[str, metrics.LogMetadata | None] = {}
+    with cache:
+        for key in keys:
+            if key not in cache:
+                continue
+
+            try:
+                cached[key] = cache[key]
+            except Exception:
+                # Unpickling can fail in any number of ways, e.g. if the pickled classes have since
+                # changed, so just let the log be reprocessed
+                continue
+
+    return cached
+
+
+def store(cache_dir: Path, results: dict[str, metrics.LogMetadata | None]) -> None:
+    """
+    Add the provided processing results to the cache.
+
+    Only each log's `LogMetadata` is cached; its flight data is reloaded from the parsed log cache
+    (see `load_flysight` & `load_gaggle`) when the cached entry is used.
+
+    Any existing entries cached by a different version of `ppg_log`, or for a previous revision of
+    one of the provided log files, are removed so the cache doesn't grow without bound.
+
+    NOTE: A result of `None` is cached for logs that could not be segmented.
+    """
+    current_ids: dict[str, tuple[str, int, int]] = {}
+    for key in results:
+        _, file_id, _ = ast.literal_eval(key)
+        current_ids[file_id[0]] = file_id
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with shelve.open(os.fspath(cache_dir / CACHE_FILENAME)) as cache:
+        stale_keys = [key for key in cache if _is_stale(key, current_ids)]
+        for key in stale_keys:
+            del cache[key]
+
+        cache.update(results)
+
+
+def _load_parsed(cache_dir: Path, log_file: Path, parse: t.Callable[[Path], ParsedT]) -> ParsedT:
+    """
+    Load the provided log using `parse`, reusing its previously parsed result if available.
+
+    Parsed logs are pickled to a file per log, keyed on the log file's identity (see `cache_key`),
+    so they can be reused across runs regardless of the processing parameters. Since each log has
+    its own file, this is safe to call from multiple worker processes.
+
+    Parsed files are prefixed by a digest of the log's resolved path, so any entries left behind by
+    a previous revision of the log (or a different version of `ppg_log`) are removed when the log
+    is reparsed.
+
+    NOTE: Parsed logs that can't be unpickled are reparsed & their cached entry is replaced.
+    """
+    path_digest = hashlib.sha1(os.fspath(log_file.resolve()).encode()).hexdigest()
+    key_digest = hashlib.sha1(cache_key(log_file).encode()).hexdigest()
+    parsed_dir = cache_dir / PARSED_LOG_DIRNAME
+    parsed_path = parsed_dir / f"{path_digest}_{key_digest}.pkl"
+    parsed: ParsedT
+    try:
+        parsed = pd.read_pickle(parsed_path)
+        return parsed
+    except Exception:
+        # Besides a missing entry, unpickling can fail in any number of ways, e.g. for a truncated
+        # or incompatible file, so fall back to parsing the log again
+        pass
+
+    parsed = parse(log_file)
+
+    # Write to a temporary file first so an interrupted write can't leave a truncated entry behind
+    parsed_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = parsed_path.with_suffix(f".{os.getpid()}.tmp")
+    pd.to_pickle(parsed, tmp_path)
+    os.replace(tmp_path, parsed_path)
+
+    for stale_path in parsed_dir.glob(f"{path_digest}_*.pkl"):
+        if stale_path != parsed_path:
+            stale_path.unlink(missing_ok=True)
+
+    return parsed
+
+
+def load_flysight(cache_dir: Path, log_file: Path) -> pd.DataFrame:
+    """Load the provided FlySight log, reusing its previously parsed `DataFrame` if available."""
+    return _load_parsed(cache_dir, log_file, parser.load_flysight)
+
+
+def load_gaggle(cache_dir: Path, log_file: Path) -> tuple[pd.DataFrame, dt.datetime]:
+    """Load the provided Gaggle log, reusing its previously parsed result if available."""
+    return _load_parsed(cache_dir, log_file, parser.load_gaggle)
@@ -1,12 +1,14 @@
 import os
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import click
 import typer
 from dotenv import load_dotenv
-from sco1_misc.prompts import prompt_for_dir, prompt_for_file
 
-from ppg_log import db, metrics
+from ppg_log import cache, metrics
 from ppg_log.cli_db import db_cli
 from ppg_log.exceptions import FlightSegmentationError
 
@@ -14,14 +16,25 @@ ppglog_cli = typer.Typer(add_completion=False)
 ppglog_cli.add_typer(db_cli, name="db", help="Interact with a PPG Log database instance.")
 
 
-load_dotenv()
-start_dir = os.environ.get("PROMPT_START_DIR", ".")
-PROMPT_START_DIR = Path(start_dir)
+def _prompt_start_dir() -> Path:
+    """Get the UI prompt start directory from the environment, defaulting to the current dir."""
+    return Path(os.environ.get("PROMPT_START_DIR", "."))
+
+
+@ppglog_cli.callback()
+def _main() -> None:
+    # Load any local .env once, before any subcommand reads its configuration from the environment
+    load_dotenv()
+
+
+def _save_summary_plot(flight_log: metrics.FlightLog, save_dir: Path) -> None:
+    """Helper for dispatching summary plot generation to a process pool."""
+    flight_log.summary_plot(show_plot=False, save_dir=save_dir)
 
 
 @ppglog_cli.command()
 def single(
-    log_filepath: Path = typer.Option(None, exists=True, file_okay=True, dir_okay=False),
+    log_filepath: Path = typer.Option(None),
     start_trim: float = typer.Option(metrics.START_TRIM),
     airborne_threshold: float = typer.Option(metrics.AIRBORNE_THRESHOLD),
     time_threshold: float = typer.Option(metrics.FLIGHT_LENGTH_THRESHOLD),
@@ -32,15 +45,23 @@ def single(
 ) -> None:
     """Single flight log processing pipeline."""
     if log_filepath is None:
+        # Defer the tkinter-backed import until a prompt is actually needed
+        from sco1_misc.prompts import prompt_for_file
+
         log_filepath = prompt_for_file(
             title="Select Flight Log",
-            start_dir=PROMPT_START_DIR,
+            start_dir=_prompt_start_dir(),
             filetypes=[
                 ("FlySight Flight Log", "*.csv"),
                 ("Gaggle Flight Log", "*.gpx"),
                 ("All Files", "*.*"),
             ],
         )
+    elif not log_filepath.is_file():
+        # Validate here rather than at parse time so the prompted path skips a redundant check
+        raise typer.BadParameter(
+            f"File '{log_filepath}' does not exist.", param_hint="--log-filepath"
+        )
 
     try:
         flight_log = metrics.process_log(
@@ -56,12 +77,15 @@ def single(
     flight_log.summary_plot(show_plot=show_plot, save_dir=plot_save_dir)
 
     if db_insert:
+        # Defer the database import so non-DB pipelines don't pay for it
+        from ppg_log import db
+
         db.insert_single(flight_log)
 
 
 @ppglog_cli.command()
 def batch(
-    log_dir: Path = typer.Option(None, exists=True, file_okay=False, dir_okay=True),
+    log_dir: Path = typer.Option(None),
     log_pattern: str = typer.Option("*.CSV"),
     start_trim: float = typer.Option(metrics.START_TRIM),
     airborne_threshold: float = typer.Option(metrics.AIRBORNE_THRESHOLD),
@@ -69,12 +93,18 @@ def batch(
     plot_save_dir: Path = typer.Option(None, file_okay=False, dir_okay=True),
     db_insert: bool = typer.Option(False),
     verbose: bool = typer.Option(True),
+    max_workers: int = typer.Option(None, min=1),
+    use_cache: bool = typer.Option(False),
 ) -> None:
     """Batch flight log processing pipeline."""
     if log_dir is None:
+        from sco1_misc.prompts import prompt_for_dir
+
         log_dir = prompt_for_dir(
-            title="Select directory for batch processing", start_dir=PROMPT_START_DIR
+            title="Select directory for batch processing", start_dir=_prompt_start_dir()
         )
+    elif not log_dir.is_dir():
+        raise typer.BadParameter(f"Directory '{log_dir}' does not exist.", param_hint="--log-dir")
 
     flight_logs = metrics.batch_process(
         top_dir=log_dir,
@@ -83,13 +113,35 @@ def batch(
         airborne_threshold=airborne_threshold,
         time_threshold=time_threshold,
         verbose=verbose,
+        max_workers=max_workers,
+        cache_dir=cache.DEFAULT_CACHE_DIR if use_cache else None,
     )
 
-    for log in flight_logs:
-        log.summary_plot(show_plot=False, save_dir=plot_save_dir)
+    # Summary plots are rendered in the background while any database insertion is done
+    plot_jobs: t.Iterable[None] = ()
+    executor = None
+    if plot_save_dir is not None:
+        plotter = partial(_save_summary_plot, save_dir=plot_save_dir)
+        if max_workers == 1 or len(flight_logs) <= 1:
+            # Don't bother spinning up a process pool if there's nothing to distribute, the plots
+            # are instead rendered in this process once any database insertion is done
+            plot_jobs = map(plotter, flight_logs)
+        else:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            plot_jobs = executor.map(plotter, flight_logs, chunksize=4)
 
-    if db_insert:
-        db.bulk_insert(flight_logs, verbose=verbose)
+    try:
+        if db_insert:
+            from ppg_log import db
+
+            db.bulk_insert(flight_logs, verbose=verbose)
+
+        # Consume the iterator so any worker exceptions are raised here
+        for _ in plot_jobs:
+            pass
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,18 +1,33 @@
 from __future__ import annotations
 
+import array
 import datetime as dt
 import os
+import sqlite3
 import typing as t
 
 import peewee as pw
-from dotenv import load_dotenv
 
 from ppg_log import metrics
 
-load_dotenv()
 DB_URL_VARNAME = "DB_URL"
-db_url = os.environ.get(DB_URL_VARNAME, "./tmp_db.db")
-flight_db = pw.SqliteDatabase(db_url)
+DEFAULT_DB_URL = "./tmp_db.db"
+INSERT_BATCH_SIZE = 100  # Keep well below SQLite's host parameter limit
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Use write-ahead logging to avoid an fsync per committed transaction, along with larger buffers
+# to cut down on small random I/O
+DB_PRAGMAS = {
+    "page_size": 8_192,  # NOTE: Only applied on creation & must be set before enabling WAL
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "cache_size": -65_536,  # Negative values are in KiB
+    "mmap_size": 268_435_456,
+    "temp_store": "memory",
+}
+# Initialization is deferred so the database URL is read from the environment on first use, after
+# the CLI has had a chance to load any local .env file
+flight_db = pw.SqliteDatabase(None)
 
 
 class BaseModel(pw.Model):
@@ -29,19 +44,16 @@ class FlightLogEntry(BaseModel):
     added_on = pw.DateTimeField(default=dt.datetime.now)
 
     @classmethod
-    def from_flight_log(cls, flight_log: metrics.FlightLog) -> FlightLogEntry:
+    def to_row_dict(cls, flight_log: metrics.FlightLog) -> dict[str, t.Any]:
         """
-        Build an unsaved model instance from the provided `FlightLog` instance.
+        Build a dictionary of row values from the provided `FlightLog` instance.
 
-        NOTE: Because this model is unsaved, for single logs this must be inserted with `.save()`.
-        For batching, `bulk_create()` accepts a list of unsaved instances so the return can be used
-        as-is.
+        This skips model construction, so it's preferred for bulk insertion via `insert_many()`.
         """
-        if flight_log.metadata.flight_segments:
-            segment_durations = ",".join(
-                str(segment.duration.total_seconds())
-                for segment in flight_log.metadata.flight_segments
-            )
+        segments = flight_log.metadata.flight_segments
+        if segments:
+            # str.join materializes a generator anyway, so build the list directly
+            segment_durations = ",".join([str(segment.duration) for segment in segments])
         else:
             segment_durations = ""
 
@@ -51,12 +63,35 @@ class FlightLogEntry(BaseModel):
         else:
             n_flights = flight_log.metadata.n_flight_segments
 
-        return cls(
-            flight_datetime=flight_log.log_datetime,
-            n_flights=n_flights,
-            total_flight_time=flight_log.metadata.total_flight_time.total_seconds(),
-            flight_segment_durations=segment_durations,
-        )
+        return {
+            "flight_datetime": flight_log.log_datetime,
+            "n_flights": n_flights,
+            "total_flight_time": flight_log.metadata.total_flight_time,
+            "flight_segment_durations": segment_durations,
+        }
+
+    @classmethod
+    def from_flight_log(cls, flight_log: metrics.FlightLog) -> FlightLogEntry:
+        """
+        Build an unsaved model instance from the provided `FlightLog` instance.
+
+        NOTE: Because this model is unsaved, for single logs this must be inserted with `.save()`.
+        """
+        return cls(**cls.to_row_dict(flight_log))
+
+
+def get_db() -> pw.Database:
+    """
+    Get the database bound to the flight log models, initializing the flight database if needed.
+
+    The flight database's URL is read from the `DB_URL` environment variable on first use, falling
+    back to a local `./tmp_db.db` if not specified.
+    """
+    database: pw.Database = FlightLogEntry._meta.database
+    if database.deferred:
+        database.init(os.environ.get(DB_URL_VARNAME, DEFAULT_DB_URL), pragmas=DB_PRAGMAS)
+
+    return database
 
 
 class SummaryTuple(t.NamedTuple):
@@ -65,13 +100,12 @@ class SummaryTuple(t.NamedTuple):
     n_logs: int
     n_flight_segments: int
     total_flight_time: dt.timedelta
-    flight_segments: list[dt.timedelta]
+    flight_segments: array.array[float]  # seconds
 
 
-def create_db() -> None:  # pragma: no cover
-    with flight_db:
-        """Initialize a brand new database."""
-        flight_db.create_tables([FlightLogEntry])
+def create_db() -> None:
+    """Initialize a brand new database."""
+    get_db().create_tables([FlightLogEntry])
 
 
 def insert_single(flight_log: metrics.FlightLog) -> None:
@@ -81,6 +115,7 @@ def insert_single(flight_log: metrics.FlightLog) -> None:
     NOTE: Row insertion is aborted if an integrity error is encountered, likely if the log already
     exists in the database.
     """
+    get_db()
     entry = FlightLogEntry.from_flight_log(flight_log)
 
     try:
@@ -102,21 +137,36 @@ def bulk_insert(flight_logs: list[metrics.FlightLog], verbose: bool = True) -> N
 
     NOTE: Flight logs whose corresponding datetime already exists in the database are ignored.
     """
-    entries = []
-    seen_dts = set()  # Keep track of duplicates within the batch itself
-    for log in flight_logs:
-        matching = FlightLogEntry.get_or_none(FlightLogEntry.flight_datetime == log.log_datetime)
-
-        if matching is None and log.log_datetime not in seen_dts:
-            entries.append(FlightLogEntry.from_flight_log(log))
-            seen_dts.add(log.log_datetime)
-        else:
-            if verbose:  # pragma: no cover
-                print(
-                    f"Flight log from {log.log_datetime} already exists in database (ID: {matching})."  # noqa: E501
+    database = get_db()
+
+    # Let SQLite resolve duplicates, both against the database & within the batch itself, in the
+    # same statement as the insertion rather than querying for existing logs first
+    rows = [FlightLogEntry.to_row_dict(log) for log in flight_logs]
+    inserted_dts: set[dt.datetime] = set()
+    with database.atomic():
+        for batch in pw.chunked(rows, INSERT_BATCH_SIZE):
+            query = FlightLogEntry.insert_many(batch).on_conflict_ignore()
+            if SQLITE_HAS_RETURNING:
+                query = query.returning(FlightLogEntry.flight_datetime).tuples()
+                inserted_dts.update(row[0] for row in query.execute())
+            else:
+                # RETURNING needs SQLite 3.35+, so fall back to checking for existing logs first
+                batch_dts = {row["flight_datetime"] for row in batch}
+                existing = FlightLogEntry.select(FlightLogEntry.flight_datetime).where(
+                    FlightLogEntry.flight_datetime.in_(batch_dts)
+                )
+                inserted_dts.update(
+                    batch_dts.difference(entry.flight_datetime for entry in existing)
                 )
+                query.execute()
 
-    FlightLogEntry.bulk_create(entries)
+    if verbose:  # pragma: no cover
+        for log in flight_logs:
+            if log.log_datetime in inserted_dts:
+                # Only the first occurrence of a duplicated log is inserted
+                inserted_dts.remove(log.log_datetime)
+            else:
+                print(f"Flight log from {log.log_datetime} already exists in database.")
 
 
 def summary_query() -> SummaryTuple:
@@ -125,28 +175,38 @@ def summary_query() -> SummaryTuple:
 
     A `SummaryTuple` instance is provided for use with downstream metrics calculations.
     """
+    get_db()
+
     # Pull easily queried values from the db
+    # SUM is NULL for an empty table, so coalesce to keep downstream arithmetic well-defined
     n_logs, n_flight_segments, total_flight_time = FlightLogEntry.select(
         pw.fn.COUNT(FlightLogEntry.flight_log_id),
-        pw.fn.SUM(FlightLogEntry.n_flights),
-        pw.fn.SUM(FlightLogEntry.total_flight_time),
+        pw.fn.COALESCE(pw.fn.SUM(FlightLogEntry.n_flights), 0),
+        pw.fn.COALESCE(pw.fn.SUM(FlightLogEntry.total_flight_time), 0),
     ).scalar(as_tuple=True)
 
-    # Catch an empty DB
-    if n_logs == 0:
+    # Catch an empty DB before bothering to query for flight segments
+    if not n_logs:
         return SummaryTuple(
             n_logs=0,
             n_flight_segments=0,
             total_flight_time=dt.timedelta(),
-            flight_segments=[],
+            flight_segments=array.array("d"),
         )
 
     # Need to deserialize the flight segments to get the rest of the summary information
-    raw_segments = FlightLogEntry.select(FlightLogEntry.flight_segment_durations).tuples()
-    all_segments = ",".join(row[0] for row in raw_segments if row[0])
-    converted_segments = [
-        dt.timedelta(seconds=float(segment)) for segment in all_segments.split(",")
-    ]
+    # Split each row individually rather than building one giant intermediate string, and stream
+    # rows from the cursor so peewee doesn't cache the full result set
+    raw_segments = (
+        FlightLogEntry.select(FlightLogEntry.flight_segment_durations).tuples().iterator()
+    )
+    # Segment durations are kept as a packed array of floats rather than boxing each one
+    converted_segments = array.array("d")
+    for (segment_durations,) in raw_segments:
+        if not segment_durations:
+            continue
+
+        converted_segments.extend(map(float, segment_durations.split(",")))
 
     return SummaryTuple(
         n_logs=n_logs,
@@ -1,31 +1,49 @@
 from __future__ import annotations
 
 import datetime as dt
+import os
 import typing as t
-from collections import deque
 from dataclasses import dataclass
 from enum import IntEnum
 from functools import cached_property, partial
-from itertools import zip_longest
 from pathlib import Path
 
-import humanize
 import numpy as np
 import pandas as pd
 
-from ppg_log import db, parser, viz
+from ppg_log import cache, parser
 from ppg_log.exceptions import FlightSegmentationError
 
+if t.TYPE_CHECKING:
+    from ppg_log import db
+
 START_TRIM = 45  # seconds
 ROLLING_WINDOW_WIDTH = 5
 AIRBORNE_THRESHOLD = 2.235  # Groundspeed, m/s
 FLIGHT_LENGTH_THRESHOLD = 15  # seconds
+LOG_DATETIME_FMT = parser.LOG_DATETIME_FMT
 
 NUMERIC_T = int | float
 
-LOG_DATETIME_FMT = r"%y-%m-%d_%H-%M-%S"
 
-HUMANIZED_DELTA = partial(humanize.precisedelta, minimum_unit="seconds", format="%d")
+def humanize_delta(delta: dt.timedelta) -> str:
+    """
+    Format the provided time delta for display, e.g. `1 hour, 2 minutes and 3 seconds`.
+
+    Zero-valued units are omitted & fractional seconds are truncated. Days are the largest unit.
+    """
+    minutes, seconds = divmod(int(delta.total_seconds()), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+
+    units = (("day", days), ("hour", hours), ("minute", minutes), ("second", seconds))
+    parts = [f"{val} {unit}{'s' if val != 1 else ''}" for unit, val in units if val]
+    if not parts:
+        return "0 seconds"
+    elif len(parts) == 1:
+        return parts[0]
+    else:
+        return f"{', '.join(parts[:-1])} and {parts[-1]}"
 
 
 class FlightMode(IntEnum):  # noqa: D101
@@ -37,15 +55,20 @@ class FlightMode(IntEnum):  # noqa: D101
 class FlightSegment:  # noqa: D101
     start_idx: int
     end_idx: int
-    duration: dt.timedelta
+    duration: float  # seconds
 
     def __str__(self) -> str:  # pragma: no cover
         return (
             f"Start idx: {self.start_idx}\n"
             f"End idx: {self.end_idx}\n"
-            f"Duration: {self.duration.seconds} seconds"
+            f"Duration: {self.as_timedelta.seconds} seconds"
         )
 
+    @property
+    def as_timedelta(self) -> dt.timedelta:
+        """Segment duration as a `timedelta` instance."""
+        return dt.timedelta(seconds=self.duration)
+
 
 @dataclass(slots=True)
 class LogMetadata:  # noqa: D101
@@ -54,12 +77,12 @@ class LogMetadata:  # noqa: D101
 
     # Flight quantities are calculated downstream
     n_flight_segments: int | None = None  # If None, no metrics calculations have been done
-    total_flight_time: dt.timedelta = dt.timedelta()
+    total_flight_time: float = 0  # seconds
     flight_segments: list[FlightSegment] | None = None
 
     def __str__(self) -> str:  # pragma: no cover
         if self.flight_segments:
-            humanized_time = HUMANIZED_DELTA(self.total_flight_time)
+            humanized_time = humanize_delta(dt.timedelta(seconds=self.total_flight_time))
         else:
             humanized_time = "No flights detected"
 
@@ -80,9 +103,13 @@ class FlightLog:  # noqa: D101
 
     @cached_property
     def log_datetime(self) -> dt.datetime:
-        """Generate a `datetime` instance from the `FlightLog`'s metadata."""
-        datestr = f"{self.metadata.log_date}_{self.metadata.log_time}"
-        return dt.datetime.strptime(datestr, LOG_DATETIME_FMT)
+        """
+        Generate a `datetime` instance from the `FlightLog`'s metadata.
+
+        NOTE: Two-digit years follow `strptime`'s convention: `69`-`99` map to the 1900s and
+        `00`-`68` map to the 2000s.
+        """
+        return parser.parse_log_datetime(self.metadata.log_date, self.metadata.log_time)
 
     def summary_plot(
         self, show_plot: bool = True, save_dir: Path | None = None
@@ -94,6 +121,9 @@ class FlightLog:  # noqa: D101
         else:
             save_path = None
 
+        # Defer the plotly-backed import so processing-only pipelines don't pay for it
+        from ppg_log import viz
+
         viz.summary_plot(self, save_path=save_path, show_plot=show_plot)
 
 
@@ -109,11 +139,17 @@ class LogSummary:  # noqa: D101
     longest_flight: dt.timedelta | None
 
     def __str__(self) -> str:  # pragma: no cover
-        if self.total_flight_time:
-            total_time = HUMANIZED_DELTA(self.total_flight_time)
-            avg_time = HUMANIZED_DELTA(self.avg_flight_time)
-            shortest_time = HUMANIZED_DELTA(self.shortest_flight)
-            longest_time = HUMANIZED_DELTA(self.longest_flight)
+        # The flight times are all calculated together, but check each one to narrow for mypy
+        if (
+            self.total_flight_time
+            and self.avg_flight_time is not None
+            and self.shortest_flight is not None
+            and self.longest_flight is not None
+        ):
+            total_time = humanize_delta(self.total_flight_time)
+            avg_time = humanize_delta(self.avg_flight_time)
+            shortest_time = humanize_delta(self.shortest_flight)
+            longest_time = humanize_delta(self.longest_flight)
 
             humanized_time = (
                 f"    Total Flight Time: {total_time}\n"
@@ -133,33 +169,30 @@ class LogSummary:  # noqa: D101
             raise ValueError("No flight logs provided.")
 
         n_segments = 0
-        flight_time = dt.timedelta()
-        shortest = dt.timedelta()
-        longest = dt.timedelta()
         for log in flight_logs:
             if log.metadata.n_flight_segments is not None:
                 n_segments += log.metadata.n_flight_segments
 
-                if log.metadata.flight_segments:  # pragma: no branch
-                    for segment in log.metadata.flight_segments:
-                        flight_time += segment.duration
-
-                        if shortest == dt.timedelta() or segment.duration < shortest:
-                            shortest = segment.duration
-
-                        if segment.duration > longest:
-                            longest = segment.duration
-        else:
-            if flight_time == dt.timedelta():
-                total_flight_time = None
-            else:
-                total_flight_time = flight_time
+        # Flatten all segment durations into a single array so aggregation happens in C rather than
+        # through per-segment comparisons
+        durations = np.fromiter(
+            (
+                segment.duration
+                for log in flight_logs
+                if log.metadata.n_flight_segments is not None and log.metadata.flight_segments
+                for segment in log.metadata.flight_segments
+            ),
+            dtype=np.float64,
+        )
 
-        if total_flight_time is not None and n_segments is not None:
-            avg_flight_time = dt.timedelta(seconds=total_flight_time.total_seconds() / n_segments)
-            shortest_flight = shortest
-            longest_flight = longest
+        total_seconds = durations.sum()
+        if total_seconds:
+            total_flight_time = dt.timedelta(seconds=total_seconds)
+            avg_flight_time = dt.timedelta(seconds=total_seconds / n_segments)
+            shortest_flight = dt.timedelta(seconds=durations.min())
+            longest_flight = dt.timedelta(seconds=durations.max())
         else:
+            total_flight_time = None
             avg_flight_time = None
             shortest_flight = None
             longest_flight = None
@@ -185,14 +218,13 @@ class LogSummary:  # noqa: D101
             seconds=db_data.total_flight_time.total_seconds() / db_data.n_flight_segments
         )
 
-        shortest = dt.timedelta()
-        longest = dt.timedelta()
-        for segment in db_data.flight_segments:
-            if shortest == dt.timedelta() or segment < shortest:
-                shortest = segment
-
-            if segment > longest:
-                longest = segment
+        durations = np.asarray(db_data.flight_segments, dtype=np.float64)
+        if durations.size:
+            shortest = dt.timedelta(seconds=durations.min())
+            longest = dt.timedelta(seconds=durations.max())
+        else:
+            shortest = dt.timedelta()
+            longest = dt.timedelta()
 
         return cls(
             n_logs=db_data.n_logs,
@@ -204,58 +236,78 @@ class LogSummary:  # noqa: D101
         )
 
 
-def _classify_flight_mode(groundspeed: float, airborne_threshold: NUMERIC_T) -> FlightMode:
-    """Classify inflight vs. on ground based on the provided groundspeed threshold."""
-    if groundspeed >= airborne_threshold:
-        return FlightMode.AIRBORNE
-    else:
-        return FlightMode.GROUND
-
-
 def classify_flight(
     flight_log: pd.DataFrame,
     window_width: int = ROLLING_WINDOW_WIDTH,
     airborne_threshold: NUMERIC_T = AIRBORNE_THRESHOLD,
-) -> pd.DataFrame:
+) -> None:
     """
     Classify inflight vs. on ground for the provided flight log based on groundspeed.
 
-    To address noise in the groundspeed measurements, a rolling window mean of `window_width`
-    groundspeeds is passed to the flight mode classifier.
-    """
-    flight_log["flight_mode"] = (
-        flight_log["groundspeed"]
-        .rolling(window_width, min_periods=1)
-        .mean()
-        .apply(_classify_flight_mode, airborne_threshold=airborne_threshold)
-    )
+    To address noise in the groundspeed measurements, a trailing rolling window mean of
+    `window_width` groundspeeds is compared against the airborne threshold. The first
+    `window_width - 1` samples are averaged over the samples available so far, and missing
+    groundspeed samples are skipped.
 
-    return flight_log
+    Flight modes are stored as `uint8` values of `FlightMode` in a `flight_mode` column added to
+    the provided `DataFrame`.
+
+    NOTE: The provided `DataFrame` is modified in place.
+    """
+    # Groundspeed precision is on the order of cm/s, so single precision is plenty & halves the
+    # memory traffic through the rolling window
+    groundspeed = flight_log["groundspeed"].to_numpy(dtype=np.float32)
+    n_samples = groundspeed.size
+    if n_samples == 0:
+        flight_log["flight_mode"] = np.empty(0, dtype=np.uint8)
+        return
+
+    # Vectorize the rolling mean: a full convolution with a ones kernel gives the trailing window
+    # sums, which then only need to be scaled by the number of samples in each window
+    # Missing samples are skipped, so they're excluded from both the window sums & the counts; this
+    # also gives the leading partial windows their per-sample count
+    kernel = np.ones(window_width, dtype=np.float32)
+    is_valid = np.isfinite(groundspeed)
+    window_sums = np.convolve(np.where(is_valid, groundspeed, 0), kernel, mode="full")[:n_samples]
+    window_counts = np.convolve(is_valid.astype(np.float32), kernel, mode="full")[:n_samples]
+
+    # Windows without any valid samples have no mean, so they're left as NaN & classify as ground
+    with np.errstate(invalid="ignore"):
+        rolling_mean = window_sums / window_counts
+
+    # Booleans are already stored as single bytes, so reinterpret rather than copy into uint8
+    flight_log["flight_mode"] = (rolling_mean >= np.float32(airborne_threshold)).view(np.uint8)
 
 
 def _segment_flights(
-    flight_data: pd.DataFrame, start_trim: NUMERIC_T, midair_start: bool
-) -> tuple[list[list[int]], list[NUMERIC_T]]:
+    elapsed_time: np.ndarray, flight_mode: np.ndarray, start_trim: NUMERIC_T, midair_start: bool
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    Identify candidate flight segments from the provided flight data.
+    Identify candidate flight segments from the provided elapsed time & flight mode arrays.
 
-    A list of `[takeoff, landing]` indices is returned along with a list of the time deltas, as
-    decimal seconds, from the end of a segment to the beginning of the next segment.
+    An `n x 2` array of `[takeoff, landing]` indices is returned along with an array of the time
+    deltas, as decimal seconds, from the end of a segment to the beginning of the next segment.
 
     If `midair_start` is `True`, it's assumed that the first segment begins at the beginning of the
     file. In this case, `start_trim` will be set to zero upstream.
-    """
-    elapsed_time = flight_data["elapsed_time"]
 
-    # Find the trim index
-    trim_idx = (elapsed_time >= start_trim).idxmax()
+    NOTE: Elapsed time is assumed to be monotonically increasing. If the log is shorter than
+    `start_trim`, no candidate segments are identified.
+    """
+    # Find the trim index; elapsed time is monotonic so we can binary search rather than scan
+    trim_idx = int(np.searchsorted(elapsed_time, start_trim, side="left"))
 
     # Find consecutive runs of inflight modes & group by start & end indices of each run
     # AKA find takeoffs & landings
-    diffs = np.abs(np.diff(flight_data["flight_mode"].iloc[trim_idx:]))
-    diffs[0] = 0
+    # Each transition is marked at the last sample of the preceding run; a transition out of the
+    # trim index itself is ignored, so comparisons start one sample past it
+    trimmed_mode = flight_mode[trim_idx + 1 :]
+    if not midair_start and not trimmed_mode.any():
+        # Ground-only logs (e.g. stray files in a batch) have no transitions to find
+        return np.empty((0, 2), dtype=np.intp), np.empty(0)
+
     # Offset by the trim index since numpy's indices will be relative to the slice
-    flights = np.flatnonzero(diffs == 1) + trim_idx
+    flights = np.flatnonzero(trimmed_mode[1:] != trimmed_mode[:-1]) + (trim_idx + 1)
 
     # Add the start index if we're assuming the flight log starts in midair. Unless something else
     # is amiss, this should give us an even number of indices
@@ -263,32 +315,29 @@ def _segment_flights(
         flights = np.concatenate(([0], flights))
 
     # Calculate time delta between flight segments, then reshape into nx2 for segment indices
-    next_segment_delta = []
-    for current_end, next_start in zip(
-        elapsed_time.iloc[flights[1:-1:2]], elapsed_time.iloc[flights[2::2]]
-    ):
-        next_segment_delta.append(next_start - current_end)
+    next_segment_delta = elapsed_time[flights[2::2]] - elapsed_time[flights[1:-1:2]]
 
     try:
-        flights = flights.reshape(-1, 2)
+        segment_idx = flights.reshape(-1, 2)
     except ValueError as e:
         raise FlightSegmentationError(
             "Could not identify start and end indices for all flight segments."
         ) from e
 
-    # Cast flights to a list on return so I don't have to deal the huge cascade of mypy errors from
-    # trying to use an ndarray with zip_longest
-    return flights.tolist(), next_segment_delta
+    return segment_idx, next_segment_delta
 
 
 def find_flights(
-    flight_data: pd.DataFrame,
+    elapsed_time: np.ndarray,
+    flight_mode: np.ndarray,
     time_threshold: NUMERIC_T,
     start_trim: NUMERIC_T,
     midair_start: bool,
-) -> list[FlightSegment] | None:
+) -> tuple[list[FlightSegment] | None, float]:
     """
-    Identify start & end indices of flight segments for the provided flight log.
+    Identify start & end indices of flight segments from the provided flight data arrays.
+
+    The identified flight segments are returned along with their total duration, in seconds.
 
     Some basic filtering is done on candidate flight segments to help mitigate false positives from
     groundspeed instability.
@@ -303,57 +352,54 @@ def find_flights(
     `start_trim`, in seconds, is used to exclude segments from the beginning of the data file.
 
     If `midair_start` is `True`, it's assumed that the log file begins while airborne.
-    """
-    elapsed_time = flight_data["elapsed_time"]
 
-    flight_segments, next_segment_delta = _segment_flights(
-        flight_data=flight_data,
+    NOTE: Logs that don't extend at least `time_threshold` past `start_trim` can't contain a valid
+    flight, so no segmentation is attempted.
+    """
+    # Flights assumed to start midair begin at the start of the log rather than after the trim
+    earliest_takeoff = 0 if midair_start else start_trim
+    if elapsed_time.size == 0 or (elapsed_time[-1] - earliest_takeoff) < time_threshold:
+        return None, 0
+
+    segment_idx, next_segment_delta = _segment_flights(
+        elapsed_time=elapsed_time,
+        flight_mode=flight_mode,
         start_trim=start_trim,
         midair_start=midair_start,
     )
-    if len(flight_segments) == 0:
-        return None
-
-    valid_flights = []
-    flight_indices: deque[int] = deque()
-    for (segment_start, segment_end), next_delta in zip_longest(
-        flight_segments, next_segment_delta
-    ):
-        segment_duration = elapsed_time.iloc[segment_end] - elapsed_time.iloc[segment_start]
-        if next_delta is not None and (segment_duration < time_threshold):
-            # Check for transient spikes
-            # These are below the duration threshold & distant from the next flight segment
-            if not flight_indices and (next_delta >= time_threshold):
-                flight_indices.clear()
-                continue
-            else:
-                # Otherwise, we'll consider this segment as part of the current flight segment
-                flight_indices.extend((segment_start, segment_end))
-        else:
-            # This is a valid flight segment and/or the last segment in the file
-            flight_indices.extend((segment_start, segment_end))
-
-        # Now check the time to the next flight segment to see if we've landed
-        if next_delta is None or (next_delta >= time_threshold):
-            takeoff_idx = flight_indices[0]
-            landing_idx = flight_indices[-1]
-            flight_indices.clear()
-
-            # Transient spikes may be close enough to combine into a segment that's shorter than the
-            # time threshold, or may end up at the very end of the file
-            # This can be discarded
-            flight_duration = dt.timedelta(
-                seconds=elapsed_time.iloc[landing_idx] - elapsed_time.iloc[takeoff_idx]
-            )
-            if flight_duration.total_seconds() < time_threshold:
-                continue
-
-            valid_flights.append(FlightSegment(takeoff_idx, landing_idx, flight_duration))
+    if len(segment_idx) == 0:
+        return None, 0
+
+    # Candidate segments are merged into a single flight until the time to the next segment meets
+    # the threshold, at which point we've landed
+    # The last segment has no next segment, so it's given an infinite time to the next segment
+    # Transient spikes while firmly on the ground are isolated segments that are both short &
+    # distant from the next segment, so they end up as short flights & are discarded below
+    landing_segments = np.flatnonzero(np.append(next_segment_delta, np.inf) >= time_threshold)
+    takeoff_segments = np.concatenate(([0], landing_segments[:-1] + 1))
+    takeoff_idx = segment_idx[takeoff_segments, 0]
+    landing_idx = segment_idx[landing_segments, 1]
+    flight_durations = elapsed_time[landing_idx] - elapsed_time[takeoff_idx]
+
+    # Transient spikes may be close enough to combine into a segment that's shorter than the time
+    # threshold, or may end up at the very end of the file
+    # These can be discarded
+    is_valid = flight_durations >= time_threshold
+    valid_flights = [
+        FlightSegment(takeoff, landing, duration)
+        for takeoff, landing, duration in zip(
+            takeoff_idx[is_valid].tolist(),
+            landing_idx[is_valid].tolist(),
+            flight_durations[is_valid].tolist(),
+            strict=True,
+        )
+    ]
+    total_flight_time = float(flight_durations[is_valid].sum())
 
     if len(valid_flights) == 0:
-        return None
+        return None, 0
     else:
-        return valid_flights
+        return valid_flights, total_flight_time
 
 
 def generate_flight_metrics(
@@ -365,62 +411,80 @@ def generate_flight_metrics(
     classify_segments: bool = True,
 ) -> FlightLog:
     """Generate flight segment information for the provided `FlightLog` instance."""
-    flight_log.flight_data = classify_flight(
-        flight_log.flight_data, airborne_threshold=airborne_threshold
-    )
+    classify_flight(flight_log.flight_data, airborne_threshold=airborne_threshold)
 
     if classify_segments:
-        flight_log.metadata.flight_segments = find_flights(
-            flight_log.flight_data,
+        # Pull the underlying arrays once rather than going through pandas for each consumer
+        flight_segments, total_flight_time = find_flights(
+            flight_log.flight_data["elapsed_time"].to_numpy(),
+            flight_log.flight_data["flight_mode"].to_numpy(),
             time_threshold=time_threshold,
             start_trim=start_trim,
             midair_start=midair_start,
         )
-        if flight_log.metadata.flight_segments:
-            flight_log.metadata.n_flight_segments = len(flight_log.metadata.flight_segments)
-            flight_log.metadata.total_flight_time = sum(
-                (segment.duration for segment in flight_log.metadata.flight_segments),
-                start=dt.timedelta(),
-            )
-        else:
-            flight_log.metadata.n_flight_segments = 0
-            flight_log.metadata.total_flight_time = dt.timedelta()
+        flight_log.metadata.flight_segments = flight_segments
+        flight_log.metadata.n_flight_segments = len(flight_segments) if flight_segments else 0
+        flight_log.metadata.total_flight_time = total_flight_time
 
     return flight_log
 
 
-def process_log(
-    log_file: Path,
-    start_trim: NUMERIC_T = START_TRIM,
-    airborne_threshold: NUMERIC_T = AIRBORNE_THRESHOLD,
-    time_threshold: NUMERIC_T = FLIGHT_LENGTH_THRESHOLD,
-    midair_start: bool = False,
-    classify_segments: bool = True,
-) -> FlightLog:
+def _load_log(log_file: str | Path, cache_dir: Path | None = None) -> FlightLog:
     """
-    Processing pipeline for an individual FlySight or Gaggle log file.
+    Load the provided FlySight or Gaggle log file into a `FlightLog` without any flight metrics.
 
-    NOTE: Processing pipeline selection between Flysight vs. Gaggle is done via case-insensitive
-    extension matching: `*.CSV` for Flysight and `*.GPX` for Gaggle.
+    See `process_log` for a description of the parameters.
     """
+    # Work with the raw path string to avoid spinning up intermediate Path objects
+    log_dir, log_name = os.path.split(os.fspath(log_file))
+    log_stem, log_suffix = os.path.splitext(log_name)
+
     # Log files are grouped by date, need to retain this since it's not in the CSV filename
-    log_date = log_file.parent.stem
+    log_date = os.path.splitext(os.path.basename(log_dir))[0]
 
-    match log_file.suffix.upper():
+    match log_suffix.upper():
         case ".CSV":
-            log_time = log_file.stem
-            flight_data = parser.load_flysight(log_file)
+            log_time = log_stem
+            if cache_dir is None:
+                flight_data = parser.load_flysight(log_file)
+            else:
+                flight_data = cache.load_flysight(cache_dir, Path(log_file))
         case ".GPX":
-            flight_data, log_datetime = parser.load_gaggle(log_file)
+            if cache_dir is None:
+                flight_data, log_datetime = parser.load_gaggle(log_file)
+            else:
+                flight_data, log_datetime = cache.load_gaggle(cache_dir, Path(log_file))
+
             log_time = log_datetime.strftime(r"%H-%M-%S")
         case _:
-            raise ValueError(f"Unsupported file type: '{log_file.suffix}'")
+            raise ValueError(f"Unsupported file type: '{log_suffix}'")
 
-    flight_log = FlightLog(
+    return FlightLog(
         flight_data=flight_data,
         metadata=LogMetadata(log_date=log_date, log_time=log_time),
     )
 
+
+def process_log(
+    log_file: str | Path,
+    start_trim: NUMERIC_T = START_TRIM,
+    airborne_threshold: NUMERIC_T = AIRBORNE_THRESHOLD,
+    time_threshold: NUMERIC_T = FLIGHT_LENGTH_THRESHOLD,
+    midair_start: bool = False,
+    classify_segments: bool = True,
+    cache_dir: Path | None = None,
+) -> FlightLog:
+    """
+    Processing pipeline for an individual FlySight or Gaggle log file.
+
+    If `cache_dir` is specified, parsed logs are cached to disk & reused on subsequent runs for log
+    files that are unchanged, regardless of the processing parameters.
+
+    NOTE: Processing pipeline selection between Flysight vs. Gaggle is done via case-insensitive
+    extension matching: `*.CSV` for Flysight and `*.GPX` for Gaggle.
+    """
+    flight_log = _load_log(log_file, cache_dir=cache_dir)
+
     # Force `start_trim` to zero if we're assuming the log starts while we're already airborne
     if midair_start:
         start_trim = 0
@@ -437,6 +501,35 @@ def process_log(
     return flight_log
 
 
+def _restore_cached_log(
+    log_file: Path, metadata: LogMetadata, cache_dir: Path, airborne_threshold: NUMERIC_T
+) -> FlightLog:
+    """
+    Helper for `batch_process` to rebuild a `FlightLog` from its cached metadata.
+
+    The log's flight data is reloaded from the parsed log cache & only its flight modes need to be
+    reclassified, the flight segments are taken from the cached metadata.
+    """
+    flight_log = _load_log(log_file, cache_dir=cache_dir)
+    classify_flight(flight_log.flight_data, airborne_threshold=airborne_threshold)
+    flight_log.metadata = metadata
+
+    return flight_log
+
+
+def _try_process_log(log_file: Path, **kwargs: t.Any) -> FlightLog | None:
+    """
+    Helper for `batch_process` to run `process_log` on the provided log file.
+
+    If the log file cannot be segmented, `None` is returned so a single problematic log doesn't
+    abort the rest of the batch.
+    """
+    try:
+        return process_log(log_file, **kwargs)
+    except FlightSegmentationError:
+        return None
+
+
 def batch_process(
     top_dir: Path,
     log_pattern: str = r"*.CSV",
@@ -445,40 +538,80 @@ def batch_process(
     time_threshold: NUMERIC_T = FLIGHT_LENGTH_THRESHOLD,
     classify_segments: bool = True,
     verbose: bool = True,
+    max_workers: int | None = None,
+    cache_dir: Path | None = None,
 ) -> list[FlightLog]:
     """
     Batch process pipeline for a directory of FlySight or Gaggle logs.
 
-    Log file discovery is not recursive by default, the `log_pattern` kwarg can be adjusted to
-    support a recursive glob.
+    Log file discovery is not recursive by default, see `parser.iter_log_files` for a description
+    of the supported `log_pattern` syntax.
+
+    Log files are processed in parallel across a pool of up to `max_workers` processes, which
+    defaults to the number of available CPUs. If `max_workers` is `1`, log files are processed
+    serially in the current process.
+
+    If `cache_dir` is specified, processing results are cached to disk & reused on subsequent runs
+    for log files that are unchanged & processed with the same parameters. Parsed logs are also
+    cached, so reprocessing unchanged logs with different parameters skips the log parsing.
 
-    NOTE: File case sensitivity is deferred to the OS; `log_pattern` is passed to glob as-is so
-    matches may or may not be case-sensitive.
+    NOTE: Log filename matching is case-insensitive, regardless of the host OS.
     """
     # Listify flight logs to get a total count
-    log_files = list(top_dir.glob(log_pattern))
+    log_files = list(parser.iter_log_files(top_dir, log_pattern))
     if verbose:
         print(f"Found {len(log_files)} log files to process.")
 
+    params: dict[str, t.Any] = {
+        "start_trim": start_trim,
+        "airborne_threshold": airborne_threshold,
+        "time_threshold": time_threshold,
+        "classify_segments": classify_segments,
+    }
+    worker = partial(_try_process_log, cache_dir=cache_dir, **params)
+
+    results: dict[Path, FlightLog | None] = {}
+    if cache_dir is not None:
+        keys = {log_file: cache.cache_key(log_file, **params) for log_file in log_files}
+        cached = cache.lookup(cache_dir, keys.values())
+        for log_file, key in keys.items():
+            if key not in cached:
+                continue
+
+            metadata = cached[key]
+            if metadata is None:
+                results[log_file] = None
+            else:
+                results[log_file] = _restore_cached_log(
+                    log_file, metadata, cache_dir, airborne_threshold
+                )
+
+    to_process = [log_file for log_file in log_files if log_file not in results]
+
+    processed = parser.map_log_files(worker, to_process, max_workers)
+    results.update(zip(to_process, processed, strict=True))
+
+    if cache_dir is not None and to_process:
+        # Only the metadata is cached, flight data is reloaded from the parsed log cache
+        to_store: dict[str, LogMetadata | None] = {}
+        for log_file in to_process:
+            flight_log = results[log_file]
+            to_store[keys[log_file]] = flight_log.metadata if flight_log is not None else None
+
+        cache.store(cache_dir, to_store)
+
     parsed_logs = []
     for log_file in log_files:
+        flight_log = results[log_file]
         if verbose:
             print(f"Processing {log_file.parent.stem}/{log_file.name} ... ", end="")
 
-        try:
-            flight_log = process_log(
-                log_file,
-                start_trim=start_trim,
-                airborne_threshold=airborne_threshold,
-                time_threshold=time_threshold,
-                classify_segments=classify_segments,
-            )
-            parsed_logs.append(flight_log)
-        except FlightSegmentationError:
+        if flight_log is None:
             if verbose:
                 print("Could not segment, skipped.")
             continue
 
+        parsed_logs.append(flight_log)
         if verbose:
             print("Done")
 
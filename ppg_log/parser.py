@@ -1,14 +1,146 @@
 from __future__ import annotations
 
 import datetime as dt
+import fnmatch
+import os
+import re
 import typing as t
 import xml.etree.ElementTree as ETree
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 N_HEADER_LINES = 2
+FLYSIGHT_COLS = ("time", "lat", "lon", "hMSL", "velN", "velE")
+# Altitude & velocities are only reported to ~cm precision, so single precision is plenty. Lat/lon
+# need the full double precision to retain sub-meter positions
+FLYSIGHT_DTYPES = {"hMSL": np.float32, "velN": np.float32, "velE": np.float32}
+RECURSIVE_GLOB = "**"
+LOG_DATETIME_FMT = r"%y-%m-%d_%H-%M-%S"
+
+T = t.TypeVar("T")
+_Components = tuple[re.Pattern | None, ...]
+
+
+@lru_cache(maxsize=16)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile the provided glob pattern component into a case-insensitive name regex."""
+    return re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+
+
+def _expand_recursive(components: _Components, states: set[int]) -> frozenset[int]:
+    """Add the component following each recursive wildcard, since they can match zero directories."""
+    expanded = set(states)
+    for pos in states:
+        while components[pos] is None:
+            pos += 1
+            expanded.add(pos)
+
+    return frozenset(expanded)
+
+
+def _walk_logs(top_dir: str, components: _Components, states: frozenset[int]) -> t.Iterator[Path]:
+    """
+    Recursion helper for `iter_log_files`; see its docstring for details.
+
+    `states` are the positions in `components` that the entries of `top_dir` can match, where a
+    `None` component is a recursive wildcard. Each directory is only listed once, regardless of how
+    many pattern components are in play.
+    """
+    last = len(components) - 1
+    with os.scandir(top_dir) as entries:
+        for entry in entries:
+            # DirEntry caches its type info from the directory listing, so no extra stat calls
+            if entry.is_dir(follow_symlinks=False):
+                next_states = set()
+                for pos in states:
+                    name_re = components[pos]
+                    if name_re is None:
+                        next_states.add(pos)
+                    elif pos < last and name_re.match(entry.name):
+                        next_states.add(pos + 1)
+
+                if next_states:
+                    yield from _walk_logs(
+                        entry.path, components, _expand_recursive(components, next_states)
+                    )
+            elif last in states and components[last].match(entry.name):  # type: ignore[union-attr]
+                yield Path(entry.path)
+
+
+def iter_log_files(top_dir: Path, pattern: str = r"*.CSV") -> t.Iterator[Path]:
+    """
+    Iterate over the log files in `top_dir` whose path matches the provided glob `pattern`.
+
+    Each `/`-separated component of `pattern` is matched against the corresponding directory level
+    below `top_dir`, e.g. `*/*.CSV` matches logs one directory down. A `**` component matches zero
+    or more directories, so log file discovery is not recursive unless one is used (e.g.
+    `**/*.CSV`). Symlinked directories are not followed.
+
+    NOTE: Matching is case-insensitive, regardless of the host OS.
+    """
+    parts = [part for part in pattern.split("/") if part not in ("", ".")]
+    if not parts or parts[-1] == RECURSIVE_GLOB:
+        # Only files are matched, so there's nothing for a trailing directory component to find
+        return
+
+    components = tuple(None if part == RECURSIVE_GLOB else _compile_pattern(part) for part in parts)
+    yield from _walk_logs(os.fspath(top_dir), components, _expand_recursive(components, {0}))
+
+
+def map_log_files(
+    func: t.Callable[[Path], T],
+    log_files: t.Sequence[Path],
+    max_workers: int | None = None,
+    lazy: bool = False,
+) -> t.Generator[T, None, None]:
+    """
+    Apply `func` to each of the provided log files, yielding the results in order.
+
+    Log files are processed in parallel across a pool of up to `max_workers` processes, which
+    defaults to the number of available CPUs. If `max_workers` is `1`, log files are processed
+    serially in the current process.
+
+    By default, all log files are dispatched up front & results are held until consumed. If `lazy`
+    is `True`, only about one log file per worker is in flight at a time & more are dispatched as
+    results are consumed, so the number of pending results stays bounded regardless of how slowly
+    the caller iterates. Any log files still pending are cancelled if iteration stops early.
+
+    NOTE: `func` must be picklable in order to be dispatched to the process pool.
+    """
+    # Don't bother spinning up a process pool if there's nothing to distribute
+    if max_workers == 1 or len(log_files) <= 1:
+        yield from map(func, log_files)
+        return
+
+    n_workers = max_workers or os.cpu_count() or 1
+    if not lazy:
+        # Most logs are small, so dispatch them in chunks to amortize the per-task IPC overhead
+        # while still giving each worker a few chunks to balance the load
+        chunksize = max(1, len(log_files) // (n_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(func, log_files, chunksize=chunksize)
+
+        return
+
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    to_dispatch = iter(log_files)
+    pending = deque(executor.submit(func, log_file) for log_file in islice(to_dispatch, n_workers))
+    try:
+        while pending:
+            result = pending.popleft().result()
+            for log_file in islice(to_dispatch, 1):
+                pending.append(executor.submit(func, log_file))
+
+            yield result
+    finally:
+        # Also reached if the caller stops iterating early, so don't wait on logs nobody wants
+        executor.shutdown(cancel_futures=True)
 
 
 def _calc_derived_vals(flight_log: pd.DataFrame, skip_gs: bool = False) -> pd.DataFrame:
@@ -22,34 +154,102 @@ def _calc_derived_vals(flight_log: pd.DataFrame, skip_gs: bool = False) -> pd.Da
     If the `skip_gs` flag is `True`, groundspeed is assumed to already be present (e.g. Gaggle logs)
     and is not recalculated.
     """
-    flight_log["time"] = pd.to_datetime(flight_log["time"])
-    flight_log["elapsed_time"] = (flight_log["time"] - flight_log["time"][0]).dt.total_seconds()
+    # Timestamps may already be parsed, e.g. if derived values are being recalculated
+    if not pd.api.types.is_datetime64_any_dtype(flight_log["time"]):
+        # Both FlySight & Gaggle timestamps are ISO 8601, so skip pandas' per-log format inference
+        flight_log["time"] = pd.to_datetime(flight_log["time"], format="ISO8601")
+
+    # Do the elapsed time arithmetic on the raw timestamps to skip pandas' timedelta accessor
+    timestamps = flight_log["time"].to_numpy(dtype="datetime64[ns]")
+    flight_log["elapsed_time"] = (timestamps - timestamps[0]) / np.timedelta64(1, "s")
 
     if not skip_gs:
-        flight_log["groundspeed"] = (flight_log["velN"] ** 2 + flight_log["velE"] ** 2).pow(1 / 2)
+        flight_log["groundspeed"] = np.hypot(
+            flight_log["velN"].to_numpy(), flight_log["velE"].to_numpy()
+        )
 
     return flight_log
 
 
-def load_flysight(filepath: Path, n_header_lines: int = N_HEADER_LINES) -> pd.DataFrame:
+def load_flysight(
+    filepath: str | Path,
+    n_header_lines: int = N_HEADER_LINES,
+    usecols: t.Sequence[str] | None = FLYSIGHT_COLS,
+) -> pd.DataFrame:
     """
     Parse the provided FlySight log into a `DataFrame`.
 
     FlySight logs are assumed to contain 2 header rows, one for labels and the other for units. By
     default, the units row is discarded.
 
+    To avoid carrying around data that isn't used downstream, only the columns specified by
+    `usecols` are loaded, which defaults to:
+        * `time`
+        * `lat`
+        * `lon`
+        * `hMSL`
+        * `velN`
+        * `velE`
+
+    If `usecols` is `None`, all columns are loaded.
+
+    Altitude & velocity columns are loaded as `float32`.
+
     The following derived columns are added to the output `DataFrame`:
         * `elapsed_time`
         * `groundspeed` (m/s)
     """
-    flight_log = pd.read_csv(filepath, header=0, skiprows=range(1, n_header_lines))
+    flight_log = pd.read_csv(
+        filepath,
+        header=0,
+        skiprows=range(1, n_header_lines),
+        usecols=usecols,
+        dtype=FLYSIGHT_DTYPES,
+    )
     flight_log = _calc_derived_vals(flight_log)
 
     return flight_log
 
 
+def _flysight_loader(cache_dir: Path | None) -> t.Callable[[Path], pd.DataFrame]:
+    """Build the FlySight log loader for the batch loaders, using the parsed log cache if set."""
+    if cache_dir is None:
+        return load_flysight
+
+    # The cache builds on this module, so defer its import to avoid a circular import
+    from ppg_log import cache
+
+    return partial(cache.load_flysight, cache_dir)
+
+
+def iter_batch_load_flysight(
+    top_dir: Path,
+    pattern: str = r"*.CSV",
+    max_workers: int | None = None,
+    cache_dir: Path | None = None,
+) -> t.Iterator[tuple[str, str, pd.DataFrame]]:
+    """
+    Iterate over a directory of FlySight logs, yielding `(log date, log time, DataFrame)` tuples.
+
+    Logs are yielded in discovery order as they are parsed rather than being collected up front.
+    Only about one log per worker is parsed ahead of the caller, so callers that don't hold on to
+    every log can keep their peak memory use down to roughly one `DataFrame` per worker.
+
+    See `batch_load_flysight` for a description of the remaining parameters.
+    """
+    log_files = list(iter_log_files(top_dir, pattern))
+    loader = _flysight_loader(cache_dir)
+    flight_logs = map_log_files(loader, log_files, max_workers=max_workers, lazy=True)
+    for log_file, flight_log in zip(log_files, flight_logs, strict=True):
+        # Log files are grouped by date, need to retain this since it's not in the filename
+        yield log_file.parent.stem, log_file.stem, flight_log
+
+
 def batch_load_flysight(
-    top_dir: Path, pattern: str = r"*.CSV"
+    top_dir: Path,
+    pattern: str = r"*.CSV",
+    max_workers: int | None = None,
+    cache_dir: Path | None = None,
 ) -> dict[str, dict[str, pd.DataFrame]]:
     """
     Batch parse a directory of FlySight logs into a dictionary of `DataFrame`s.
@@ -58,17 +258,27 @@ def batch_load_flysight(
     information, the date is inferred from the log's parent directory name & the output dictionary
     is of the form `{log date: {log_time: DataFrame}}`.
 
-    Log file discovery is not recursive by default, the `pattern` kwarg can be adjusted to support
-    a recursive glob.
+    Log file discovery is not recursive by default, see `iter_log_files` for a description of the
+    supported `pattern` syntax.
 
-    NOTE: File case sensitivity is deferred to the OS; `pattern` is passed to glob as-is so matches
-    may or may not be case-sensitive.
+    Log files are parsed in parallel across a pool of up to `max_workers` processes, which defaults
+    to the number of available CPUs. If `max_workers` is `1`, log files are parsed serially in the
+    current process.
+
+    If `cache_dir` is specified, parsed logs are cached to disk & reused on subsequent runs for log
+    files that are unchanged.
+
+    NOTE: All parsed logs are held in memory; use `iter_batch_load_flysight` to process logs one at
+    a time instead.
+    NOTE: Log filename matching is case-insensitive, regardless of the host OS.
     """
+    log_files = list(iter_log_files(top_dir, pattern))
+    flight_logs = map_log_files(_flysight_loader(cache_dir), log_files, max_workers=max_workers)
+
     parsed_logs: dict[str, dict[str, pd.DataFrame]] = defaultdict(dict)
-    for log_file in top_dir.glob(pattern):
+    for log_file, flight_log in zip(log_files, flight_logs, strict=True):
         # Log files are grouped by date, need to retain this since it's not in the CSV filename
-        log_date = log_file.parent.stem
-        parsed_logs[log_date][log_file.stem] = load_flysight(log_file)
+        parsed_logs[log_file.parent.stem][log_file.stem] = flight_log
 
     return parsed_logs
 
@@ -102,7 +312,7 @@ def _validated_find_text(point: ETree.Element, element: str) -> str:
     return subelement.text
 
 
-def load_gaggle(filepath: Path) -> tuple[pd.DataFrame, dt.datetime]:
+def load_gaggle(filepath: str | Path) -> tuple[pd.DataFrame, dt.datetime]:
     """
     Parse the provided Gaggle GPX log into a `DataFrame`.
 
@@ -113,26 +323,66 @@ def load_gaggle(filepath: Path) -> tuple[pd.DataFrame, dt.datetime]:
     Gaggle's GPX files contain a subset of the information that a Flysight provides, but still
     contains enough information to conduct the downstream metrics calculations.
     """
-    tree = ETree.parse(filepath)
-    root = tree.getroot()
-
-    log_datetime = dt.datetime.fromisoformat(_validated_find_text(root, "metadata/time"))
-
+    log_datetime = None
     flight_log = GaggleTrack(time=[], lat=[], lon=[], hMSL=[], groundspeed=[])
-    points = root.findall(".*//trkseg/trkpt")
-    for point in points:
-        flight_log["lat"].append(float(_validated_get(point, "lat")))
-        flight_log["lon"].append(float(_validated_get(point, "lon")))
-        flight_log["time"].append(_validated_find_text(point, "time"))
-        flight_log["hMSL"].append(float(_validated_find_text(point, "ele")))
-        flight_log["groundspeed"].append(float(_validated_find_text(point, "extensions/speed")))
+
+    # Stream the log rather than building the full element tree up front; each trackpoint is
+    # complete by its end event & is cleared once parsed so memory use doesn't grow with the log
+    for _, elem in ETree.iterparse(filepath):
+        if elem.tag == "trkpt":
+            flight_log["lat"].append(float(_validated_get(elem, "lat")))
+            flight_log["lon"].append(float(_validated_get(elem, "lon")))
+            flight_log["time"].append(_validated_find_text(elem, "time"))
+            flight_log["hMSL"].append(float(_validated_find_text(elem, "ele")))
+            flight_log["groundspeed"].append(float(_validated_find_text(elem, "extensions/speed")))
+            elem.clear()
+        elif elem.tag == "metadata":
+            log_datetime = dt.datetime.fromisoformat(_validated_find_text(elem, "time"))
+
+    if log_datetime is None:
+        raise ValueError("Could not locate element 'metadata/time' for the current log.")
 
     flight_df = pd.DataFrame(flight_log)
+    if all(timestamp.endswith("Z") for timestamp in flight_log["time"]):
+        # NumPy parses ISO 8601 timestamps natively & much faster than pandas, but doesn't accept
+        # timezone designators so the UTC designator is stripped & added back after parsing
+        utc_times = np.array([timestamp[:-1] for timestamp in flight_log["time"]], "datetime64[ns]")
+        flight_df["time"] = pd.Series(utc_times).dt.tz_localize("UTC")
+
     flight_df = _calc_derived_vals(flight_df, skip_gs=True)
 
     return flight_df, log_datetime
 
 
+@lru_cache(maxsize=4096)
+def parse_log_datetime(log_date: str, log_time: str) -> dt.datetime:
+    """
+    Generate a `datetime` instance from the provided `YY-mm-dd` log date & `HH-MM-SS` log time.
+
+    NOTE: Two-digit years follow `strptime`'s convention: `69`-`99` map to the 1900s and `00`-`68`
+    map to the 2000s.
+    """
+    # Fast path for the fixed-width YY-MM-DD & HH-MM-SS layout, falling back to strptime for
+    # anything else so malformed values are reported as usual
+    fields = (
+        log_date[:2],
+        log_date[3:5],
+        log_date[6:],
+        log_time[:2],
+        log_time[3:5],
+        log_time[6:],
+    )
+    is_fixed_width = len(log_date) == len(log_time) == 8
+    if is_fixed_width and log_date[2::3] == log_time[2::3] == "--":
+        if all(field.isdecimal() for field in fields):
+            year, month, day, hour, minute, second = map(int, fields)
+            year += 2000 if year < 69 else 1900
+            return dt.datetime(year, month, day, hour, minute, second)
+
+    datestr = f"{log_date}_{log_time}"
+    return dt.datetime.strptime(datestr, LOG_DATETIME_FMT)
+
+
 def logpath2datetime(log_filepath: Path) -> dt.datetime:
     """
     Generate a `datetime` instance from the provided FlySight log filepath.
@@ -140,5 +390,4 @@ def logpath2datetime(log_filepath: Path) -> dt.datetime:
     It is assumed that the log file is named `HH-MM-SS.CSV` and contained in a parent directory
     named `YY-mm-dd`.
     """
-    datestr = f"{log_filepath.parent.stem}_{log_filepath.stem}"
-    return dt.datetime.strptime(datestr, r"%y-%m-%d_%H-%M-%S")
+    return parse_log_datetime(log_filepath.parent.stem, log_filepath.stem)
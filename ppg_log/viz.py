@@ -1,15 +1,42 @@
 from __future__ import annotations
 
+import datetime as dt
 from pathlib import Path
 
-import humanize
 import numpy as np
-import pandas as pd
 import plotly.graph_objects as go
 
 from ppg_log import metrics
 
-pd.options.plotting.backend = "plotly"
+# Static layout shared by all summary plots, validated once rather than on every plot call
+BASE_LAYOUT = go.Layout(
+    xaxis={"title": "Elapsed Time (s)", "domain": [0, 0.75]},
+    yaxis={"title": "Groundspeed (m/s)"},
+    yaxis2={
+        "title": "Altitude (m MSL)",
+        "anchor": "x",
+        "overlaying": "y",
+        "side": "right",
+    },
+    yaxis3={
+        "title": "Flight Segments",
+        "anchor": "free",
+        "overlaying": "y",
+        "side": "right",
+        "position": 0.85,
+        "nticks": 2,
+        "range": (0, 1.25),
+    },
+    yaxis4={
+        "title": "Flight Mode",
+        "anchor": "free",
+        "overlaying": "y",
+        "side": "right",
+        "position": 0.90,
+        "nticks": 2,
+        "range": (0, 1.25),
+    },
+)
 
 
 def summary_plot(
@@ -32,8 +59,13 @@ def summary_plot(
     If `show_plot` is `True`, the plot is displayed on screen.
 
     If `show_flight_mode` is True, the Flight Mode classification is added (useful for debugging).
+
+    NOTE: If the plot is neither saved nor shown, no plot is generated.
     """
-    fig = go.Figure()
+    if not (save_path or show_plot):
+        return
+
+    fig = go.Figure(layout=BASE_LAYOUT)
     elapsed_time = flight_log.flight_data["elapsed_time"]
     fig.add_trace(
         go.Scatter(
@@ -53,15 +85,14 @@ def summary_plot(
 
     # Plot Flight Segments
     if flight_log.metadata.flight_segments is not None:
+        elapsed_time_arr = elapsed_time.to_numpy()
         for idx, segment in enumerate(flight_log.metadata.flight_segments, start=1):
-            # Build an array of ones for the y values
-            n_values = len(elapsed_time.iloc[segment.start_idx : segment.end_idx + 1])
-            const_array = np.ones(n_values) * 1.2
+            segment_time = elapsed_time_arr[segment.start_idx : segment.end_idx + 1]
 
             fig.add_trace(
                 go.Scatter(
-                    x=elapsed_time.iloc[segment.start_idx : segment.end_idx + 1],
-                    y=const_array,
+                    x=segment_time,
+                    y=np.full(segment_time.size, 1.2),
                     name=f"Flight {idx}",
                     yaxis="y3",
                 )
@@ -77,8 +108,8 @@ def summary_plot(
             ),
         )
 
-    humanized_time = humanize.precisedelta(
-        flight_log.metadata.total_flight_time, minimum_unit="seconds", format="%d"
+    humanized_time = metrics.humanize_delta(
+        dt.timedelta(seconds=flight_log.metadata.total_flight_time)
     )
     title_str = (
         f"{flight_log.metadata.log_date} {flight_log.metadata.log_time}<br>"
@@ -88,32 +119,6 @@ def summary_plot(
 
     fig.update_layout(
         title={"text": title_str, "x": 0.5, "y": 0.9, "xanchor": "center", "yanchor": "top"},
-        xaxis={"title": "Elapsed Time (s)", "domain": [0, 0.75]},
-        yaxis={"title": "Groundspeed (m/s)"},
-        yaxis2={
-            "title": "Altitude (m MSL)",
-            "anchor": "x",
-            "overlaying": "y",
-            "side": "right",
-        },
-        yaxis3={
-            "title": "Flight Segments",
-            "anchor": "free",
-            "overlaying": "y",
-            "side": "right",
-            "position": 0.85,
-            "nticks": 2,
-            "range": (0, 1.25),
-        },
-        yaxis4={
-            "title": "Flight Mode",
-            "anchor": "free",
-            "overlaying": "y",
-            "side": "right",
-            "position": 0.90,
-            "nticks": 2,
-            "range": (0, 1.25),
-        },
     )
 
     if save_path:
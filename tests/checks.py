@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import datetime as dt
 import typing as t
 
 import pandas as pd
@@ -31,13 +30,10 @@ def segment_isclose(
     flight: metrics.FlightSegment,
     truth: metrics.FlightSegment,
     idx_tol: int,
-    duration_tol: dt.timedelta,
+    duration_tol: float,
 ) -> None:
-    flight_duration = flight.duration.total_seconds()
-    truth_duration = truth.duration.total_seconds()
-    tol = duration_tol.total_seconds()
-    duration_msg = f"Duration check failed. Segment: {flight_duration}, Truth: {truth_duration}, Tolerance: {tol}"  # noqa: E501
-    assert flight_duration == pytest.approx(truth_duration, abs=tol), duration_msg
+    duration_msg = f"Duration check failed. Segment: {flight.duration}, Truth: {truth.duration}, Tolerance: {duration_tol}"  # noqa: E501
+    assert flight.duration == pytest.approx(truth.duration, abs=duration_tol), duration_msg
 
     start_idx_msg = f"Start idx check failed. Segment: {flight.start_idx}, Truth: {truth.start_idx}, Tolerance: {idx_tol}"  # noqa: E501
     end_idx_msg = f"End idx check failed. Segment: {flight.end_idx}, Truth: {truth.end_idx}, Tolerance: {idx_tol}"  # noqa: E501
@@ -1,3 +1,4 @@
+import array
 import datetime as dt
 from functools import partial
 
@@ -11,6 +12,7 @@ TEST_DB = pw.SqliteDatabase(":memory:")
 
 
 DUMMY_DURATION = dt.timedelta(seconds=5)
+DUMMY_SECONDS = DUMMY_DURATION.total_seconds()
 PARTIAL_SEGMENT = partial(FlightSegment, start_idx=-1, end_idx=-1)
 PARTIAL_META = partial(LogMetadata, log_date="22-04-20", log_time="04-20-00")
 
@@ -18,8 +20,8 @@ DUMMY_FLIGHT_LOG = FlightLog(
     flight_data=None,
     metadata=PARTIAL_META(
         n_flight_segments=1,
-        total_flight_time=DUMMY_DURATION,
-        flight_segments=[PARTIAL_SEGMENT(duration=DUMMY_DURATION)],
+        total_flight_time=DUMMY_SECONDS,
+        flight_segments=[PARTIAL_SEGMENT(duration=DUMMY_SECONDS)],
     ),
 )
 
@@ -30,8 +32,8 @@ DUMMY_BULK_LOGS = [
         metadata=PARTIAL_META(
             log_date="22-04-21",
             n_flight_segments=1,
-            total_flight_time=DUMMY_DURATION,
-            flight_segments=[PARTIAL_SEGMENT(duration=DUMMY_DURATION)],
+            total_flight_time=DUMMY_SECONDS,
+            flight_segments=[PARTIAL_SEGMENT(duration=DUMMY_SECONDS)],
         ),
     ),
 ]
@@ -110,15 +112,42 @@ def test_bulk_insert_ignore_duplicates_empty_db(session: None) -> None:
     assert n_rows == 1
 
 
+@pytest.mark.parametrize(("has_returning",), ((True,), (False,)))
+def test_bulk_insert_reports_duplicates(
+    session: None,
+    capsys: pytest.CaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    has_returning: bool,
+) -> None:
+    monkeypatch.setattr(db, "SQLITE_HAS_RETURNING", has_returning)
+
+    db.insert_single(DUMMY_FLIGHT_LOG)
+    db.bulk_insert([*DUMMY_BULK_LOGS, DUMMY_BULK_LOGS[1]], verbose=True)
+
+    n_rows = db.FlightLogEntry.select(pw.fn.COUNT(db.FlightLogEntry.flight_log_id)).scalar()
+    assert n_rows == 2
+    assert capsys.readouterr().out.count("already exists in database") == 2
+
+
 def test_flight_log_empty_segments() -> None:
     entry = db.FlightLogEntry.from_flight_log(DUMMY_FLIGHT_LOG_NO_FLIGHTS)
 
     assert entry.flight_segment_durations == ""
 
 
+def test_row_dict_empty_segments() -> None:
+    row = db.FlightLogEntry.to_row_dict(DUMMY_FLIGHT_LOG_NO_FLIGHTS)
+
+    assert row["n_flights"] == 0
+    assert row["flight_segment_durations"] == ""
+
+
 def test_summary_empty_db(session: None) -> None:
     truth_summary = db.SummaryTuple(
-        n_logs=0, n_flight_segments=0, total_flight_time=dt.timedelta(), flight_segments=[]
+        n_logs=0,
+        n_flight_segments=0,
+        total_flight_time=dt.timedelta(),
+        flight_segments=array.array("d"),
     )
 
     assert db.summary_query() == truth_summary
@@ -131,7 +160,7 @@ SUMMARY_QUERIES = (
             n_logs=1,
             n_flight_segments=1,
             total_flight_time=DUMMY_DURATION,
-            flight_segments=[DUMMY_DURATION],
+            flight_segments=array.array("d", [DUMMY_SECONDS]),
         ),
     ),
     (
@@ -140,7 +169,7 @@ SUMMARY_QUERIES = (
             n_logs=2,
             n_flight_segments=2,
             total_flight_time=dt.timedelta(seconds=10),
-            flight_segments=[DUMMY_DURATION, DUMMY_DURATION],
+            flight_segments=array.array("d", [DUMMY_SECONDS, DUMMY_SECONDS]),
         ),
     ),
     (
@@ -149,7 +178,7 @@ SUMMARY_QUERIES = (
             n_logs=2,
             n_flight_segments=1,
             total_flight_time=DUMMY_DURATION,
-            flight_segments=[DUMMY_DURATION],
+            flight_segments=array.array("d", [DUMMY_SECONDS]),
         ),
     ),
 )
@@ -1,4 +1,3 @@
-import datetime as dt
 import typing as t
 from functools import partial
 from pathlib import Path
@@ -27,7 +26,29 @@ FLIGHT_MODE_CASES = [
 
 @pytest.mark.parametrize(("speed", "truth_mode"), FLIGHT_MODE_CASES)
 def test_mode_classification(speed: int | float, truth_mode: metrics.FlightMode) -> None:
-    assert metrics._classify_flight_mode(speed, TEST_THRESHOLD) == truth_mode
+    flight_data = pd.DataFrame({"groundspeed": [speed]})
+    metrics.classify_flight(flight_data, airborne_threshold=TEST_THRESHOLD)
+
+    assert flight_data["flight_mode"].iloc[0] == truth_mode
+
+
+NAN = float("nan")
+ROLLING_MODE_CASES = [
+    ([0, 10, 10, 10, 0], [0, 1, 1, 1, 1]),  # Trailing mean of 5 keeps the last sample airborne
+    ([10, 0, 0, 0, 0, 0], [1, 1, 0, 0, 0, 0]),
+    ([4, 6, 4, 6, 4, 6], [0, 1, 0, 1, 0, 1]),  # Partial windows at the start of the log
+    ([6, 6, NAN, 6, 6, 6, 0, 0, 0, 0], [1, 1, 1, 1, 1, 1, 0, 0, 0, 0]),  # Missing samples skipped
+    ([NAN, NAN, 6, 0], [0, 0, 1, 0]),  # Windows with no samples are on the ground
+    ([], []),
+]
+
+
+@pytest.mark.parametrize(("speeds", "truth_modes"), ROLLING_MODE_CASES)
+def test_rolling_mode_classification(speeds: list[float], truth_modes: list[int]) -> None:
+    flight_data = pd.DataFrame({"groundspeed": speeds}, dtype=float)
+    metrics.classify_flight(flight_data, airborne_threshold=TEST_THRESHOLD)
+
+    assert flight_data["flight_mode"].tolist() == truth_modes
 
 
 class DataTruthMap(t.NamedTuple):
@@ -35,8 +56,8 @@ class DataTruthMap(t.NamedTuple):
     flight_segments: list[metrics.FlightSegment] | None
 
 
-DURATION_TOL = dt.timedelta(seconds=1)
-IDX_TOL = DURATION_TOL.total_seconds() // 0.2  # Sample rate assumed to be 5 Hz
+DURATION_TOL = 1  # seconds
+IDX_TOL = DURATION_TOL // 0.2  # Sample rate assumed to be 5 Hz
 
 PARTIAL_LOG = partial(
     metrics.FlightLog, metadata=metrics.LogMetadata(log_date="2022-04-20", log_time="04-20-00")
@@ -49,7 +70,7 @@ CLASSIFICATION_TEST_CASES = (
                 metrics.FlightSegment(
                     start_idx=605,
                     end_idx=4052,
-                    duration=dt.timedelta(seconds=691),
+                    duration=691,
                 ),
             ],
         ),
@@ -73,7 +94,7 @@ CLASSIFICATION_TEST_CASES = (
                 metrics.FlightSegment(
                     start_idx=1631,
                     end_idx=8101,
-                    duration=dt.timedelta(seconds=1294),
+                    duration=1294,
                 ),
             ],
         ),
@@ -85,7 +106,7 @@ CLASSIFICATION_TEST_CASES = (
                 metrics.FlightSegment(
                     start_idx=1666,
                     end_idx=17332,
-                    duration=dt.timedelta(seconds=3133),
+                    duration=3133,
                 ),
             ],
         ),
@@ -97,17 +118,17 @@ CLASSIFICATION_TEST_CASES = (
                 metrics.FlightSegment(
                     start_idx=1564,
                     end_idx=3155,
-                    duration=dt.timedelta(seconds=318),
+                    duration=318,
                 ),
                 metrics.FlightSegment(
                     start_idx=5207,
                     end_idx=6409,
-                    duration=dt.timedelta(seconds=240),
+                    duration=240,
                 ),
                 metrics.FlightSegment(
                     start_idx=11370,
                     end_idx=13684,
-                    duration=dt.timedelta(seconds=462),
+                    duration=462,
                 ),
             ],
         ),
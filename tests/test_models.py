@@ -1,11 +1,52 @@
 import datetime as dt
 
-from ppg_log.metrics import FlightLog, LOG_DATETIME_FMT, LogMetadata
+import pytest
 
+from ppg_log.metrics import FlightLog, LOG_DATETIME_FMT, LogMetadata, humanize_delta
 
-def test_log_datetime() -> None:
-    log = FlightLog(
-        flight_data=None, metadata=LogMetadata(log_date="22-04-20", log_time="04-20-00")
-    )
+LOG_DATETIME_CASES = (
+    ("22-04-20", "04-20-00"),
+    ("68-12-31", "23-59-59"),
+    ("69-01-01", "00-00-00"),
+)
 
-    assert log.log_datetime == dt.datetime.strptime("22-04-20_04-20-00", LOG_DATETIME_FMT)
+
+@pytest.mark.parametrize(("log_date", "log_time"), LOG_DATETIME_CASES)
+def test_log_datetime(log_date: str, log_time: str) -> None:
+    log = FlightLog(flight_data=None, metadata=LogMetadata(log_date=log_date, log_time=log_time))
+
+    truth_datetime = dt.datetime.strptime(f"{log_date}_{log_time}", LOG_DATETIME_FMT)
+    assert log.log_datetime == truth_datetime
+
+
+MALFORMED_DATETIME_CASES = (
+    ("2022-04-20", "04-20-00"),
+    ("22-04-20", "04:20:00"),
+    ("22-13-20", "04-20-00"),
+    ("sample_data", "04-20-00"),
+)
+
+
+@pytest.mark.parametrize(("log_date", "log_time"), MALFORMED_DATETIME_CASES)
+def test_malformed_log_datetime_raises(log_date: str, log_time: str) -> None:
+    log = FlightLog(flight_data=None, metadata=LogMetadata(log_date=log_date, log_time=log_time))
+
+    with pytest.raises(ValueError):
+        _ = log.log_datetime
+
+
+HUMANIZED_DELTA_CASES = (
+    (dt.timedelta(), "0 seconds"),
+    (dt.timedelta(seconds=1), "1 second"),
+    (dt.timedelta(seconds=3.7), "3 seconds"),
+    (dt.timedelta(seconds=60), "1 minute"),
+    (dt.timedelta(seconds=61), "1 minute and 1 second"),
+    (dt.timedelta(seconds=7322), "2 hours, 2 minutes and 2 seconds"),
+    (dt.timedelta(days=1, seconds=61), "1 day, 1 minute and 1 second"),
+    (dt.timedelta(days=40), "40 days"),
+)
+
+
+@pytest.mark.parametrize(("delta", "truth_str"), HUMANIZED_DELTA_CASES)
+def test_humanize_delta(delta: dt.timedelta, truth_str: str) -> None:
+    assert humanize_delta(delta) == truth_str
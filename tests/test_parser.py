@@ -1,4 +1,5 @@
 import datetime as dt
+import typing as t
 from pathlib import Path
 
 import pytest
@@ -33,6 +34,56 @@ def test_logpath2datetime(filepath: Path, truth_datetime: dt.datetime) -> None:
     assert parser.logpath2datetime(filepath) == truth_datetime
 
 
+LOG_TREE = (
+    "21-04-20/12-00-00.CSV",
+    "21-04-20/12-30-00.csv",
+    "21-04-20/notes.txt",
+    "21-04-21/nested/13-00-00.CSV",
+    "13-00-00.CSV",
+)
+
+LOG_DISCOVERY_CASES: tuple[tuple[str, set[str]], ...] = (
+    ("*.CSV", {"13-00-00.CSV"}),
+    (
+        "**/*.CSV",
+        {
+            "21-04-20/12-00-00.CSV",
+            "21-04-20/12-30-00.csv",
+            "21-04-21/nested/13-00-00.CSV",
+            "13-00-00.CSV",
+        },
+    ),
+    ("**/12*.CSV", {"21-04-20/12-00-00.CSV", "21-04-20/12-30-00.csv"}),
+    ("**/*.gpx", set()),
+    ("*/*.CSV", {"21-04-20/12-00-00.CSV", "21-04-20/12-30-00.csv"}),
+    ("21-04*/*.CSV", {"21-04-20/12-00-00.CSV", "21-04-20/12-30-00.csv"}),
+    ("*/*/*.CSV", {"21-04-21/nested/13-00-00.CSV"}),
+    ("21-04-21/**/*.CSV", {"21-04-21/nested/13-00-00.CSV"}),
+    ("**/nested/**/*.CSV", {"21-04-21/nested/13-00-00.CSV"}),
+    ("21-05-01/**/*.CSV", set()),
+)
+
+
+@pytest.fixture
+def log_tree(tmp_path: Path) -> Path:
+    for rel_path in LOG_TREE:
+        log_file = tmp_path / rel_path
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        log_file.touch()
+
+    return tmp_path
+
+
+@pytest.mark.parametrize(("pattern", "truth_names"), LOG_DISCOVERY_CASES)
+def test_iter_log_files(log_tree: Path, pattern: str, truth_names: set[str]) -> None:
+    found = list(parser.iter_log_files(log_tree, pattern))
+    assert {log_file.relative_to(log_tree).as_posix() for log_file in found} == truth_names
+
+
+def test_recursive_log_discovery_count(log_tree: Path) -> None:
+    assert len(list(parser.iter_log_files(log_tree, "**/*.CSV"))) == 4
+
+
 def test_log_parse() -> None:
     sample_flight_log = SAMPLE_DATA_DIR / "21-04-20.CSV"
     flight_data = parser.load_flysight(sample_flight_log)
@@ -43,12 +94,127 @@ def test_log_parse() -> None:
         checks.is_dtype(flight_data, col_name, pd_type_check)
 
 
-def test_batch_log_parse() -> None:
+def test_log_parse_usecols() -> None:
+    sample_flight_log = SAMPLE_DATA_DIR / "21-04-20.CSV"
+
+    flight_data = parser.load_flysight(sample_flight_log)
+    assert "velD" not in flight_data.columns
+
+    flight_data = parser.load_flysight(sample_flight_log, usecols=None)
+    assert "velD" in flight_data.columns
+
+
+def test_batch_log_parse_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sample_log_pattern = "21*.CSV"
+    parser.batch_load_flysight(SAMPLE_DATA_DIR, pattern=sample_log_pattern, cache_dir=tmp_path)
+
+    def _fail(*args: t.Any, **kwargs: t.Any) -> None:
+        raise AssertionError("Cached log files should not be reparsed.")
+
+    monkeypatch.setattr(parser, "load_flysight", _fail)
+    flight_logs = parser.batch_load_flysight(
+        SAMPLE_DATA_DIR, pattern=sample_log_pattern, max_workers=1, cache_dir=tmp_path
+    )
+
+    assert set(flight_logs["sample_data"]) == BATCH_LOG_STEMS
+
+
+def test_derived_vals_parsed_time() -> None:
+    flight_data = parser.load_flysight(SAMPLE_DATA_DIR / "21-04-20.CSV")
+    truth_time = flight_data["time"].copy()
+
+    # Timestamps that are already parsed should pass through unchanged
+    flight_data = parser._calc_derived_vals(flight_data)
+    assert flight_data["time"].equals(truth_time)
+
+
+@pytest.mark.parametrize(("max_workers",), ((None,), (1,)))
+def test_batch_log_parse(max_workers: int | None) -> None:
     sample_log_pattern = "21*.CSV"  # Limit to a subset of the sample data
-    flight_logs = parser.batch_load_flysight(SAMPLE_DATA_DIR, pattern=sample_log_pattern)
+    flight_logs = parser.batch_load_flysight(
+        SAMPLE_DATA_DIR, pattern=sample_log_pattern, max_workers=max_workers
+    )
 
     # Check top level dir name
     assert "sample_data" in flight_logs
 
     # Check that the log files are loaded & keyed correctly
     assert set(flight_logs["sample_data"]) == BATCH_LOG_STEMS
+
+
+def test_batch_log_parse_case_insensitive() -> None:
+    flight_logs = parser.batch_load_flysight(SAMPLE_DATA_DIR, pattern="21*.csv", max_workers=1)
+    assert set(flight_logs["sample_data"]) == BATCH_LOG_STEMS
+
+
+def test_lazy_map_log_files() -> None:
+    log_files = [Path(f"{idx:02}-00-00.CSV") for idx in range(10)]
+
+    mapped = parser.map_log_files(str, log_files, max_workers=2, lazy=True)
+    assert list(mapped) == [str(log_file) for log_file in log_files]
+
+
+def test_lazy_map_log_files_early_stop() -> None:
+    log_files = [Path(f"{idx:02}-00-00.CSV") for idx in range(10)]
+
+    mapped = parser.map_log_files(str, log_files, max_workers=2, lazy=True)
+    assert next(mapped) == str(log_files[0])
+    mapped.close()
+
+
+def test_iter_batch_log_parse() -> None:
+    parsed = list(
+        parser.iter_batch_load_flysight(SAMPLE_DATA_DIR, pattern="21*.CSV", max_workers=1)
+    )
+
+    assert {log_date for log_date, _, _ in parsed} == {"sample_data"}
+    assert {log_time for _, log_time, _ in parsed} == BATCH_LOG_STEMS
+
+
+SAMPLE_GPX = """<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" creator="Gaggle">
+  <metadata><time>2023-05-01T12:00:00+00:00</time></metadata>
+  <trk><trkseg>
+    <trkpt lat="33.1" lon="-117.1">
+      <ele>100.5</ele><time>2023-05-01T12:00:00Z</time><extensions><speed>1.5</speed></extensions>
+    </trkpt>
+    <trkpt lat="33.2" lon="-117.2">
+      <ele>101.5</ele><time>2023-05-01T12:00:02Z</time><extensions><speed>2.5</speed></extensions>
+    </trkpt>
+  </trkseg></trk>
+</gpx>
+"""
+
+
+def test_gaggle_parse(tmp_path: Path) -> None:
+    log_filepath = tmp_path / "gaggle.gpx"
+    log_filepath.write_text(SAMPLE_GPX)
+
+    flight_data, log_datetime = parser.load_gaggle(log_filepath)
+
+    assert log_datetime == dt.datetime(2023, 5, 1, 12, tzinfo=dt.timezone.utc)
+    assert flight_data["lat"].tolist() == [33.1, 33.2]
+    assert flight_data["groundspeed"].tolist() == [1.5, 2.5]
+    assert flight_data["elapsed_time"].tolist() == [0, 2]
+
+
+def test_gaggle_parse_no_metadata_time_raises(tmp_path: Path) -> None:
+    log_filepath = tmp_path / "gaggle.gpx"
+    log_filepath.write_text(
+        SAMPLE_GPX.replace("<metadata><time>2023-05-01T12:00:00+00:00</time></metadata>", "")
+    )
+
+    with pytest.raises(ValueError, match="metadata/time"):
+        parser.load_gaggle(log_filepath)
+
+
+def test_gaggle_parse_ns_timestamps(tmp_path: Path) -> None:
+    log_filepath = tmp_path / "gaggle.gpx"
+    log_filepath.write_text(
+        SAMPLE_GPX.replace("12:00:00Z", "12:00:00.123456789Z").replace("12:00:02Z", "12:00:01.5Z")
+    )
+
+    flight_data, _ = parser.load_gaggle(log_filepath)
+
+    assert flight_data["time"].dtype == "datetime64[ns, UTC]"
+    assert flight_data["elapsed_time"].iloc[1] == pytest.approx(1.376543211, abs=1e-12)
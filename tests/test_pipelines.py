@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import os
+import shelve
+import typing as t
 from pathlib import Path
 
 import pytest
 
-from ppg_log import metrics
+from ppg_log import cache, metrics, parser
 
 SAMPLE_DATA_DIR = Path(__file__).parent / "sample_data"
 SAMPLE_LOG_PATTERN = "21*.CSV"  # Limit to a subset of the sample data
@@ -17,6 +20,20 @@ def test_single_log_process() -> None:
     assert flight_log.metadata.n_flight_segments == 1
 
 
+def test_short_log_process() -> None:
+    # Log is shorter than the default start trim so there's nothing to segment
+    flight_log = metrics.process_log(SAMPLE_DATA_DIR / "21-04-20.CSV")
+
+    assert flight_log.metadata.n_flight_segments == 0
+
+
+def test_single_log_process_str_path() -> None:
+    flight_log = metrics.process_log(str(SAMPLE_LOG))
+
+    assert flight_log.metadata.log_date == "sample_data"
+    assert flight_log.metadata.log_time == "13-46-02"
+
+
 def test_batch_process() -> None:
     flight_logs = metrics.batch_process(
         SAMPLE_DATA_DIR, log_pattern=SAMPLE_LOG_PATTERN, classify_segments=False, verbose=False
@@ -25,6 +42,100 @@ def test_batch_process() -> None:
     assert len(flight_logs) == 2
 
 
+def test_batch_process_serial() -> None:
+    flight_logs = metrics.batch_process(
+        SAMPLE_DATA_DIR,
+        log_pattern=SAMPLE_LOG_PATTERN,
+        classify_segments=False,
+        verbose=False,
+        max_workers=1,
+    )
+
+    assert len(flight_logs) == 2
+
+
+def test_batch_process_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    flight_logs = metrics.batch_process(
+        SAMPLE_DATA_DIR,
+        log_pattern=SAMPLE_LOG_PATTERN,
+        classify_segments=False,
+        verbose=False,
+        cache_dir=tmp_path,
+    )
+
+    def _fail(*args: t.Any, **kwargs: t.Any) -> None:
+        raise AssertionError("Cached log files should not be reprocessed.")
+
+    monkeypatch.setattr(metrics, "process_log", _fail)
+    cached_logs = metrics.batch_process(
+        SAMPLE_DATA_DIR,
+        log_pattern=SAMPLE_LOG_PATTERN,
+        classify_segments=False,
+        verbose=False,
+        max_workers=1,
+        cache_dir=tmp_path,
+    )
+
+    truth_times = {log.metadata.log_time for log in flight_logs}
+    assert {log.metadata.log_time for log in cached_logs} == truth_times
+
+    # Flight data isn't cached with the metadata, so it should be rebuilt from the parsed logs
+    for cached_log in cached_logs:
+        assert "flight_mode" in cached_log.flight_data.columns
+
+
+def test_cache_key_versioned(monkeypatch: pytest.MonkeyPatch) -> None:
+    key = cache.cache_key(SAMPLE_LOG)
+
+    monkeypatch.setattr(cache, "__version__", "0.0.0")
+    assert cache.cache_key(SAMPLE_LOG) != key
+
+
+def test_stale_parsed_log_removed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    metrics.process_log(SAMPLE_LOG, cache_dir=tmp_path)
+    stale_paths = set((tmp_path / cache.PARSED_LOG_DIRNAME).iterdir())
+
+    monkeypatch.setattr(cache, "__version__", "0.0.0")
+    metrics.process_log(SAMPLE_LOG, cache_dir=tmp_path)
+    parsed_paths = set((tmp_path / cache.PARSED_LOG_DIRNAME).iterdir())
+
+    assert len(parsed_paths) == 1
+    assert parsed_paths.isdisjoint(stale_paths)
+
+
+def test_stale_metadata_removed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache.store(tmp_path, {cache.cache_key(SAMPLE_LOG): None})
+
+    monkeypatch.setattr(cache, "__version__", "0.0.0")
+    key = cache.cache_key(SAMPLE_LOG)
+    cache.store(tmp_path, {key: None})
+
+    with shelve.open(os.fspath(tmp_path / cache.CACHE_FILENAME), flag="r") as cached:
+        assert list(cached) == [key]
+
+
+def test_corrupt_parsed_log_reparsed(tmp_path: Path) -> None:
+    flight_log = metrics.process_log(SAMPLE_LOG, cache_dir=tmp_path)
+
+    for parsed_path in (tmp_path / cache.PARSED_LOG_DIRNAME).iterdir():
+        parsed_path.write_bytes(b"not a pickle")
+
+    cached_log = metrics.process_log(SAMPLE_LOG, cache_dir=tmp_path)
+    assert cached_log.metadata.n_flight_segments == flight_log.metadata.n_flight_segments
+
+
+def test_parsed_log_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    flight_log = metrics.process_log(SAMPLE_LOG, cache_dir=tmp_path)
+
+    def _fail(*args: t.Any, **kwargs: t.Any) -> None:
+        raise AssertionError("Cached log files should not be reparsed.")
+
+    monkeypatch.setattr(parser, "load_flysight", _fail)
+    cached_log = metrics.process_log(SAMPLE_LOG, time_threshold=30, cache_dir=tmp_path)
+
+    assert cached_log.metadata.n_flight_segments == flight_log.metadata.n_flight_segments
+
+
 def test_batch_process_verbose(capsys: pytest.CaptureFixture) -> None:
     metrics.batch_process(
         SAMPLE_DATA_DIR, log_pattern=SAMPLE_LOG_PATTERN, classify_segments=False, verbose=True
@@ -1,3 +1,4 @@
+import array
 import datetime as dt
 from functools import partial
 
@@ -7,6 +8,7 @@ from ppg_log import db
 from ppg_log.metrics import FlightLog, FlightSegment, LogMetadata, LogSummary
 
 DUMMY_DURATION = dt.timedelta(seconds=5)
+DUMMY_SECONDS = DUMMY_DURATION.total_seconds()
 PARTIAL_SEGMENT = partial(FlightSegment, start_idx=-1, end_idx=-1)
 PARTIAL_META = partial(LogMetadata, log_date="2022-04-20", log_time="04-20-00")
 PARTIAL_LOG = partial(FlightLog, flight_data=None)
@@ -28,8 +30,8 @@ METADATA_CASES = (
         PARTIAL_LOG(
             metadata=PARTIAL_META(
                 n_flight_segments=1,
-                total_flight_time=DUMMY_DURATION,
-                flight_segments=[PARTIAL_SEGMENT(duration=DUMMY_DURATION)],
+                total_flight_time=DUMMY_SECONDS,
+                flight_segments=[PARTIAL_SEGMENT(duration=DUMMY_SECONDS)],
             )
         ),
         LogSummary(
@@ -45,10 +47,10 @@ METADATA_CASES = (
         PARTIAL_LOG(
             metadata=PARTIAL_META(
                 n_flight_segments=2,
-                total_flight_time=DUMMY_DURATION,
+                total_flight_time=DUMMY_SECONDS,
                 flight_segments=[
-                    PARTIAL_SEGMENT(duration=DUMMY_DURATION),
-                    PARTIAL_SEGMENT(duration=dt.timedelta(seconds=3)),
+                    PARTIAL_SEGMENT(duration=DUMMY_SECONDS),
+                    PARTIAL_SEGMENT(duration=3.0),
                 ],
             )
         ),
@@ -75,8 +77,8 @@ BATCH_METADATA_CASES = (
             PARTIAL_LOG(
                 metadata=PARTIAL_META(
                     n_flight_segments=1,
-                    total_flight_time=DUMMY_DURATION,
-                    flight_segments=[PARTIAL_SEGMENT(duration=DUMMY_DURATION)],
+                    total_flight_time=DUMMY_SECONDS,
+                    flight_segments=[PARTIAL_SEGMENT(duration=DUMMY_SECONDS)],
                 )
             ),
             PARTIAL_LOG(
@@ -100,15 +102,15 @@ BATCH_METADATA_CASES = (
             PARTIAL_LOG(
                 metadata=PARTIAL_META(
                     n_flight_segments=1,
-                    total_flight_time=DUMMY_DURATION,
-                    flight_segments=[PARTIAL_SEGMENT(duration=DUMMY_DURATION)],
+                    total_flight_time=DUMMY_SECONDS,
+                    flight_segments=[PARTIAL_SEGMENT(duration=DUMMY_SECONDS)],
                 )
             ),
             PARTIAL_LOG(
                 metadata=PARTIAL_META(
                     n_flight_segments=1,
-                    total_flight_time=DUMMY_DURATION,
-                    flight_segments=[PARTIAL_SEGMENT(duration=DUMMY_DURATION)],
+                    total_flight_time=DUMMY_SECONDS,
+                    flight_segments=[PARTIAL_SEGMENT(duration=DUMMY_SECONDS)],
                 )
             ),
         ],
@@ -140,7 +142,7 @@ DB_METADATA_CASES = (
             n_logs=1,
             n_flight_segments=1,
             total_flight_time=DUMMY_DURATION,
-            flight_segments=[DUMMY_DURATION],
+            flight_segments=array.array("d", [DUMMY_SECONDS]),
         ),
         LogSummary(
             n_logs=1,
@@ -156,7 +158,7 @@ DB_METADATA_CASES = (
             n_logs=1,
             n_flight_segments=2,
             total_flight_time=dt.timedelta(seconds=8),
-            flight_segments=[dt.timedelta(seconds=3), DUMMY_DURATION],
+            flight_segments=array.array("d", [3, DUMMY_SECONDS]),
         ),
         LogSummary(
             n_logs=1,
@@ -172,7 +174,7 @@ DB_METADATA_CASES = (
             n_logs=1,
             n_flight_segments=3,
             total_flight_time=dt.timedelta(seconds=12),
-            flight_segments=[dt.timedelta(seconds=3), DUMMY_DURATION, dt.timedelta(seconds=4)],
+            flight_segments=array.array("d", [3, DUMMY_SECONDS, 4]),
         ),
         LogSummary(
             n_logs=1,
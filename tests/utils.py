@@ -29,7 +29,7 @@ def dump_sample_json(
     Data to dump may be selected using `start_idx` & `end_idx`, which follow Python's `slice`
     semantics.
     """
-    flight_data[keep_cols].iloc[slice(start_idx, end_idx)].to_json(out_filepath)
+    flight_data.iloc[slice(start_idx, end_idx)][keep_cols].to_json(out_filepath)
 
 
 def json_from_file(
@@ -72,4 +72,4 @@ def dump_sample_csv(
     Data to dump may be selected using `start_idx` & `end_idx`, which follow Python's `slice`
     semantics.
     """
-    flight_data[keep_cols].iloc[slice(start_idx, end_idx)].to_csv(out_filepath)
+    flight_data.iloc[slice(start_idx, end_idx)][keep_cols].to_csv(out_filepath)